@@ -0,0 +1,51 @@
+/**
+ * Worker-thread entry point for conversions
+ * Slice mode (workerData carries a file list): convert the slice, post the
+ * per-file results back in a single message, then exit
+ * Persistent mode (no workerData): serve single-file tasks over the message
+ * port until the parent exits, so tool calls reuse one warm thread instead
+ * of paying worker bootstrap per call
+ */
+
+import { parentPort, workerData } from 'worker_threads';
+import { convertIpynbToMd, convertMdToIpynb } from './converter-logic';
+import { ConversionDirection, ConversionResult } from './types';
+
+interface BatchWorkerData {
+  direction: ConversionDirection;
+  files: string[];
+  outputDir: string;
+  fenceMarker?: string;
+  skipMkdir?: boolean;
+}
+
+interface SingleFileTask {
+  id: number;
+  direction: ConversionDirection;
+  sourcePath: string;
+  outputDir: string;
+  fenceMarker?: string;
+}
+
+const data = workerData as BatchWorkerData | undefined;
+
+if (data && Array.isArray(data.files)) {
+  const { direction, files, outputDir, fenceMarker, skipMkdir } = data;
+
+  const results: { path: string; result: ConversionResult }[] = files.map((file) => ({
+    path: file,
+    result: direction === 'ipynb_to_md'
+      ? convertIpynbToMd(file, outputDir, skipMkdir)
+      : convertMdToIpynb(file, outputDir, fenceMarker, skipMkdir)
+  }));
+
+  parentPort!.postMessage(results);
+} else {
+  parentPort!.on('message', (task: SingleFileTask) => {
+    const result = task.direction === 'ipynb_to_md'
+      ? convertIpynbToMd(task.sourcePath, task.outputDir)
+      : convertMdToIpynb(task.sourcePath, task.outputDir, task.fenceMarker);
+
+    parentPort!.postMessage({ id: task.id, result });
+  });
+}
@@ -2,25 +2,248 @@
  * Converter logic for Jupyter Notebook <-> Markdown conversion
  */
 
+import * as crypto from 'crypto';
 import * as fs from 'fs';
+import * as os from 'os';
 import * as path from 'path';
-import { JupyterNotebook, NotebookCell, ConversionResult } from './types';
+import { Worker, threadId } from 'worker_threads';
+import {
+  JupyterNotebook,
+  NotebookCell,
+  NotebookMetadata,
+  ConversionResult,
+  ConversionDirection,
+  BatchConversionResult
+} from './types';
 
 // Cell boundary marker for preserving cell structure
 const CELL_BOUNDARY = '<!-- NOTEBOOK_CELL_BOUNDARY -->';
 
+// Default code-fence marker; callers can override it (e.g. '~~~') per call
+const DEFAULT_FENCE_MARKER = '```';
+
+// On-disk index of previous conversions, stored per output directory.
+// Keyed by a hash of the resolved source path; an entry is valid while the
+// source's mtime and size are unchanged and its output file still exists.
+const CACHE_FILE_NAME = '.jmm_cache.json';
+
+// Emptiness predicate that scans without allocating a trimmed copy
+const NON_WHITESPACE = /\S/;
+
+// Progress logging goes to stderr — stdout carries the MCP protocol — and
+// can be silenced with JMM_QUIET=1. Messages use printf-style placeholders
+// so nothing is formatted when logging is disabled.
+const LOG_ENABLED = process.env.JMM_QUIET !== '1';
+
+function log(format: string, ...args: unknown[]): void {
+  if (LOG_ENABLED) {
+    console.error(format, ...args);
+  }
+}
+
+interface CacheEntry {
+  mtime_ms: number;
+  size: number;
+  result: ConversionResult;
+}
+
+function cacheKey(sourceFile: string): string {
+  return crypto.createHash('sha1').update(sourceFile).digest('hex');
+}
+
+function readCache(outputPath: string): Record<string, CacheEntry> {
+  try {
+    const parsed = JSON.parse(fs.readFileSync(path.join(outputPath, CACHE_FILE_NAME), 'utf-8'));
+    // Guard the shape, not just the parse: a file containing `null`, a
+    // number or an array parses fine but would blow up on indexing later
+    if (parsed && typeof parsed === 'object' && !Array.isArray(parsed)) {
+      return parsed;
+    }
+  } catch {
+    // Fall through to a fresh cache
+  }
+  return {};
+}
+
+function writeCache(outputPath: string, cache: Record<string, CacheEntry>): void {
+  // Write-then-rename so concurrent readers (batch workers share one output
+  // directory) never observe a torn index; rename is atomic on one volume
+  const target = path.join(outputPath, CACHE_FILE_NAME);
+  const temp = `${target}.${process.pid}.${threadId}.tmp`;
+  try {
+    fs.writeFileSync(temp, JSON.stringify(cache), 'utf-8');
+    fs.renameSync(temp, target);
+  } catch {
+    // The cache is best-effort; the conversion output is already on disk
+    try {
+      fs.rmSync(temp, { force: true });
+    } catch {
+      // Leftover temp file is harmless
+    }
+  }
+}
+
+/**
+ * Return the cached result for an unchanged source file, or null on a miss
+ */
+function checkCache(
+  cache: Record<string, CacheEntry>,
+  key: string,
+  stats: fs.Stats
+): ConversionResult | null {
+  const entry = cache[key];
+  if (
+    entry &&
+    entry.mtime_ms === stats.mtimeMs &&
+    entry.size === stats.size &&
+    entry.result.output_path &&
+    fs.existsSync(entry.result.output_path)
+  ) {
+    return { ...entry.result, cached: true };
+  }
+  return null;
+}
+
+// Cell constructors — plain objects with the v4 defaults, no validation pass
+function markdownCell(source: string): NotebookCell {
+  return { cell_type: 'markdown', source, metadata: {} };
+}
+
+function codeCell(source: string): NotebookCell {
+  return { cell_type: 'code', source, metadata: {}, outputs: [], execution_count: null };
+}
+
+/**
+ * Parse one boundary-delimited markdown section into notebook cells
+ * Code fences are line-anchored, so a single forward pass with a text/code
+ * state machine is enough — no backtracking regex and no per-match group
+ * allocation. Runs in O(section length) regardless of fence placement.
+ */
+function parseSectionCells(
+  section: string,
+  cellCount: Record<string, number>,
+  fenceMarker: string = DEFAULT_FENCE_MARKER
+): NotebookCell[] {
+  const sectionCells: NotebookCell[] = [];
+  const lines = section.split('\n');
+
+  let inCode = false;
+  let language = '';
+  let openingFence = '';
+  let buf: string[] = [];
+
+  const flushMarkdown = () => {
+    const text = buf.join('\n').trim();
+    if (text) {
+      sectionCells.push(markdownCell(text));
+      cellCount.markdown++;
+    }
+    buf = [];
+  };
+
+  const flushCode = () => {
+    const code = buf.join('\n').trim();
+    if (code) {
+      // Add language comment for non-python code
+      const cellSource = language && language.toLowerCase() !== 'python'
+        ? `# Language: ${language}\n${code}`
+        : code;
+      sectionCells.push(codeCell(cellSource));
+      cellCount.code++;
+    }
+    buf = [];
+  };
+
+  for (const line of lines) {
+    if (line.startsWith(fenceMarker)) {
+      if (inCode) {
+        flushCode();
+        inCode = false;
+      } else {
+        flushMarkdown();
+        const infoMatch = line.slice(fenceMarker.length).trim().match(/^\w+/);
+        language = infoMatch ? infoMatch[0] : '';
+        openingFence = line;
+        inCode = true;
+      }
+    } else {
+      buf.push(line);
+    }
+  }
+
+  if (inCode) {
+    // Unclosed fence at end of section: treat the opener and its buffered
+    // lines as markdown text, matching the old regex's no-match behaviour
+    buf.unshift(openingFence);
+  }
+  flushMarkdown();
+
+  return sectionCells;
+}
+
+/**
+ * Render one notebook cell (plus its trailing boundary marker when needed)
+ * into a markdown block; returns '' for cells that produce no output
+ * Kept pure — cell and lookahead in, string out — so chunks of cells could
+ * be mapped across a worker pool if per-cell rendering ever dominates
+ */
+function renderCell(cell: NotebookCell, next: NotebookCell | undefined): string {
+  const source = Array.isArray(cell.source) ? cell.source.join('') : cell.source;
+  if (!NON_WHITESPACE.test(source)) {
+    return '';
+  }
+
+  if (cell.cell_type === 'markdown') {
+    // Add cell boundary marker between consecutive markdown cells
+    return next && next.cell_type === 'markdown'
+      ? `${source}\n\n${CELL_BOUNDARY}\n\n`
+      : `${source}\n\n`;
+  }
+  if (cell.cell_type === 'code') {
+    return `\`\`\`python\n${source}\n\`\`\`\n\n`;
+  }
+  if (cell.cell_type === 'raw') {
+    // Add cell boundary marker after raw cells if next is markdown/raw
+    return next && (next.cell_type === 'markdown' || next.cell_type === 'raw')
+      ? `${source}\n\n${CELL_BOUNDARY}\n\n`
+      : `${source}\n\n`;
+  }
+  return '';
+}
+
+// Metadata template shared by every generated notebook; it is only ever
+// serialized, never mutated, so one frozen instance is reused across calls
+const NOTEBOOK_METADATA: NotebookMetadata = Object.freeze({
+  kernelspec: {
+    display_name: 'Python 3',
+    language: 'python',
+    name: 'python3'
+  },
+  language_info: {
+    name: 'python',
+    version: '3.9.0',
+    mimetype: 'text/x-python',
+    file_extension: '.py'
+  }
+});
+
 /**
  * Convert Jupyter Notebook (.ipynb) file to Markdown (.md)
  * Code cell execution results (outputs) are excluded
  * Preserves cell boundaries using special markers
  */
-export function convertIpynbToMd(sourcePath: string, outputDir: string): ConversionResult {
+export function convertIpynbToMd(
+  sourcePath: string,
+  outputDir: string,
+  skipMkdir: boolean = false
+): ConversionResult {
   try {
     const sourceFile = path.resolve(sourcePath);
     const outputPath = path.resolve(outputDir);
 
-    // Validate input file exists
-    if (!fs.existsSync(sourceFile)) {
+    // One stat both validates existence and feeds the conversion cache key
+    const sourceStats = fs.statSync(sourceFile, { throwIfNoEntry: false });
+    if (!sourceStats) {
       throw new Error(`Source file not found: ${sourcePath}`);
     }
 
@@ -29,77 +252,72 @@ export function convertIpynbToMd(sourcePath: string, outputDir: string): Convers
       throw new Error(`Source file must be a .ipynb file, got: ${ext}`);
     }
 
-    // Create output directory if it doesn't exist
-    if (!fs.existsSync(outputPath)) {
+    // Create output directory if it doesn't exist; batch callers create it
+    // once up front and skip the per-file check
+    if (!skipMkdir && !fs.existsSync(outputPath)) {
       fs.mkdirSync(outputPath, { recursive: true });
     }
 
     const outputFile = path.join(outputPath, `${path.basename(sourceFile, '.ipynb')}.md`);
 
-    console.log(`Starting conversion of '${path.basename(sourceFile)}' to Markdown...`);
+    // Skip the conversion entirely when the source is unchanged since the
+    // last run and its output is still in place
+    const cache = readCache(outputPath);
+    const key = cacheKey(sourceFile);
+    const cachedResult = checkCache(cache, key, sourceStats);
+    if (cachedResult) {
+      log('Source unchanged, reusing cached conversion. File: %s', cachedResult.output_path);
+      return cachedResult;
+    }
 
-    // Read and parse notebook
-    const notebookContent = fs.readFileSync(sourceFile, 'utf-8');
-    const notebook: JupyterNotebook = JSON.parse(notebookContent);
+    log("Starting conversion of '%s' to Markdown...", path.basename(sourceFile));
 
+    // Read and parse the raw notebook JSON directly — only cell_type and
+    // source are consumed, so a full nbformat-style validation pass is
+    // unnecessary. A cheap structural check keeps the error message clear.
+    const notebook: JupyterNotebook = JSON.parse(fs.readFileSync(sourceFile, 'utf-8'));
+    if (!Array.isArray(notebook.cells)) {
+      throw new Error(`Invalid notebook: missing "cells" array in ${path.basename(sourceFile)}`);
+    }
+
+    // Each entry is a fully formatted block ending in "\n\n", so the output
+    // is assembled with a single join('') and a final trim instead of
+    // interleaved '' separators plus a trailing-pop cleanup loop
     const markdownContent: string[] = [];
     const cellCount: Record<string, number> = { markdown: 0, code: 0, raw: 0 };
 
-    // Process each cell
-    notebook.cells.forEach((cell, i) => {
-      const source = Array.isArray(cell.source) ? cell.source.join('') : cell.source;
-
-      if (cell.cell_type === 'markdown') {
-        if (source.trim()) {
-          markdownContent.push(source);
-          // Add cell boundary marker between consecutive markdown cells
-          if (i < notebook.cells.length - 1 && notebook.cells[i + 1].cell_type === 'markdown') {
-            markdownContent.push('');
-            markdownContent.push(CELL_BOUNDARY);
-          }
-          markdownContent.push('');
-        }
-        cellCount.markdown++;
-      } else if (cell.cell_type === 'code') {
-        if (source.trim()) {
-          markdownContent.push('```python');
-          markdownContent.push(source);
-          markdownContent.push('```');
-          markdownContent.push('');
-        }
-        cellCount.code++;
-      } else if (cell.cell_type === 'raw') {
-        if (source.trim()) {
-          markdownContent.push(source);
-          // Add cell boundary marker after raw cells if next is markdown/raw
-          if (i < notebook.cells.length - 1 &&
-              ['markdown', 'raw'].includes(notebook.cells[i + 1].cell_type)) {
-            markdownContent.push('');
-            markdownContent.push(CELL_BOUNDARY);
-          }
-          markdownContent.push('');
-        }
-        cellCount.raw++;
+    // Process each cell, keeping one local reference to the lookahead cell
+    // instead of re-indexing notebook.cells for every boundary check
+    const cells = notebook.cells;
+    for (let i = 0; i < cells.length; i++) {
+      const cell = cells[i];
+
+      if (cellCount[cell.cell_type] !== undefined) {
+        cellCount[cell.cell_type]++;
       }
-    });
 
-    // Remove trailing empty lines
-    while (markdownContent.length > 0 && !markdownContent[markdownContent.length - 1].trim()) {
-      markdownContent.pop();
+      const block = renderCell(cell, i + 1 < cells.length ? cells[i + 1] : undefined);
+      if (block) {
+        markdownContent.push(block);
+      }
     }
 
     // Write output file
-    fs.writeFileSync(outputFile, markdownContent.join('\n'), 'utf-8');
+    fs.writeFileSync(outputFile, markdownContent.join('').trimEnd() + '\n', 'utf-8');
 
     const totalCells = Object.values(cellCount).reduce((a, b) => a + b, 0);
-    console.log(`Conversion successful. Processed ${totalCells} cells. File: ${outputFile}`);
+    log('Conversion successful. Processed %d cells. File: %s', totalCells, outputFile);
 
-    return {
+    const result: ConversionResult = {
       status: 'success',
       output_path: outputFile,
       cells_processed: cellCount,
       total_cells: totalCells
     };
+    cache[key] = { mtime_ms: sourceStats.mtimeMs, size: sourceStats.size, result };
+    writeCache(outputPath, cache);
+
+    return result;
   } catch (error) {
     console.error(`ipynb conversion failed: ${error}`);
     return {
@@ -114,13 +332,19 @@ export function convertIpynbToMd(sourcePath: string, outputDir: string): Convers
  * Code blocks are converted to code cells, everything else to markdown cells
  * Respects cell boundary markers to preserve original cell structure
  */
-export function convertMdToIpynb(sourcePath: string, outputDir: string): ConversionResult {
+export function convertMdToIpynb(
+  sourcePath: string,
+  outputDir: string,
+  fenceMarker: string = DEFAULT_FENCE_MARKER,
+  skipMkdir: boolean = false
+): ConversionResult {
   try {
     const sourceFile = path.resolve(sourcePath);
     const outputPath = path.resolve(outputDir);
 
-    // Validate input file exists
-    if (!fs.existsSync(sourceFile)) {
+    // One stat both validates existence and feeds the conversion cache key
+    const sourceStats = fs.statSync(sourceFile, { throwIfNoEntry: false });
+    if (!sourceStats) {
       throw new Error(`Source file not found: ${sourcePath}`);
     }
 
@@ -129,115 +353,60 @@ export function convertMdToIpynb(sourcePath: string, outputDir: string): Convers
       throw new Error(`Source file must be a .md or .markdown file, got: ${ext}`);
     }
 
-    // Create output directory if it doesn't exist
-    if (!fs.existsSync(outputPath)) {
+    // Create output directory if it doesn't exist; batch callers create it
+    // once up front and skip the per-file check
+    if (!skipMkdir && !fs.existsSync(outputPath)) {
       fs.mkdirSync(outputPath, { recursive: true });
     }
 
     const outputFile = path.join(outputPath, `${path.basename(sourceFile, ext)}.ipynb`);
 
-    console.log(`Starting conversion of '${path.basename(sourceFile)}' to Jupyter Notebook...`);
+    // Skip the conversion entirely when the source is unchanged since the
+    // last run and its output is still in place. The fence marker is part
+    // of the key: the same file parsed with a different marker is a
+    // different conversion.
+    const cache = readCache(outputPath);
+    const key = cacheKey(`${sourceFile}\0${fenceMarker}`);
+    const cachedResult = checkCache(cache, key, sourceStats);
+    if (cachedResult) {
+      log('Source unchanged, reusing cached conversion. File: %s', cachedResult.output_path);
+      return cachedResult;
+    }
+
+    log("Starting conversion of '%s' to Jupyter Notebook...", path.basename(sourceFile));
 
-    // Read Markdown file
+    // Read Markdown file in one shot. Node has no mmap; readFileSync with an
+    // encoding decodes straight from the page cache into a single JS string,
+    // which the whole-content scan below needs anyway.
     const content = fs.readFileSync(sourceFile, 'utf-8');
 
     // Create new notebook structure
     const notebook: JupyterNotebook = {
       nbformat: 4,
       nbformat_minor: 5,
-      metadata: {
-        kernelspec: {
-          display_name: 'Python 3',
-          language: 'python',
-          name: 'python3'
-        },
-        language_info: {
-          name: 'python',
-          version: '3.9.0',
-          mimetype: 'text/x-python',
-          file_extension: '.py'
-        }
-      },
+      metadata: NOTEBOOK_METADATA,
       cells: []
     };
 
-    // Enhanced code block pattern (supports various languages)
-    const codeBlockPattern = /```(?:(\w+))?\s*\n(.*?)\n```/gs;
-
-    // Split content by cell boundaries to preserve structure
-    const contentSections = content.split(CELL_BOUNDARY);
-
     const cellCount: Record<string, number> = { markdown: 0, code: 0 };
 
-    for (const section of contentSections) {
+    // Walk the cell boundary markers with indexOf/slice so only the current
+    // section is materialized, instead of splitting all sections up front
+    let pos = 0;
+    while (pos <= content.length) {
+      const markerIndex = content.indexOf(CELL_BOUNDARY, pos);
+      const section = markerIndex === -1 ? content.slice(pos) : content.slice(pos, markerIndex);
+      pos = markerIndex === -1 ? content.length + 1 : markerIndex + CELL_BOUNDARY.length;
+
       const sectionTrimmed = section.trim();
       if (!sectionTrimmed) continue;
 
-      // Process each section for code blocks
-      let lastEnd = 0;
-      const sectionCells: NotebookCell[] = [];
-
-      const matches = Array.from(sectionTrimmed.matchAll(codeBlockPattern));
-
-      for (const match of matches) {
-        const start = match.index!;
-        const end = start + match[0].length;
-        const language = match[1] || 'python';
-        const code = match[2].trim();
-
-        // Add markdown text before code block
-        if (start > lastEnd) {
-          const text = sectionTrimmed.slice(lastEnd, start).trim();
-          if (text) {
-            sectionCells.push({
-              cell_type: 'markdown',
-              source: text,
-              metadata: {}
-            });
-            cellCount.markdown++;
-          }
-        }
-
-        // Add code cell
-        if (code) {
-          let cellSource = code;
-          // Add language comment for non-python code
-          if (language.toLowerCase() !== 'python') {
-            cellSource = `# Language: ${language}\n${code}`;
-          }
-          sectionCells.push({
-            cell_type: 'code',
-            source: cellSource,
-            metadata: {},
-            outputs: [],
-            execution_count: null
-          });
-          cellCount.code++;
-        }
-
-        lastEnd = end;
-      }
-
-      // Process remaining text after last code block
-      if (lastEnd < sectionTrimmed.length) {
-        const text = sectionTrimmed.slice(lastEnd).trim();
-        if (text) {
-          sectionCells.push({
-            cell_type: 'markdown',
-            source: text,
-            metadata: {}
-          });
-          cellCount.markdown++;
-        }
-      }
+      // Process each section for code blocks with the single-pass scanner
+      const sectionCells = parseSectionCells(sectionTrimmed, cellCount, fenceMarker);
 
       // If no code blocks found, treat entire section as markdown
       if (sectionCells.length === 0 && sectionTrimmed) {
-        sectionCells.push({
-          cell_type: 'markdown',
-          source: sectionTrimmed,
-          metadata: {}
-        });
+        sectionCells.push(markdownCell(sectionTrimmed));
         cellCount.markdown++;
       }
 
@@ -246,13 +415,7 @@ export function convertMdToIpynb(sourcePath: string, outputDir: string): Convers
 
     // If no cells created, add one empty code cell
     if (notebook.cells.length === 0) {
-      notebook.cells.push({
-        cell_type: 'code',
-        source: '',
-        metadata: {},
-        outputs: [],
-        execution_count: null
-      });
+      notebook.cells.push(codeCell(''));
       cellCount.code = 1;
     }
 
@@ -260,14 +423,18 @@ export function convertMdToIpynb(sourcePath: string, outputDir: string): Convers
     fs.writeFileSync(outputFile, JSON.stringify(notebook, null, 2), 'utf-8');
 
     const totalCells = Object.values(cellCount).reduce((a, b) => a + b, 0);
-    console.log(`Conversion successful. Created ${totalCells} cells. File: ${outputFile}`);
+    log('Conversion successful. Created %d cells. File: %s', totalCells, outputFile);
 
-    return {
+    const result: ConversionResult = {
       status: 'success',
       output_path: outputFile,
       cells_created: cellCount,
       total_cells: totalCells
     };
+    cache[key] = { mtime_ms: sourceStats.mtimeMs, size: sourceStats.size, result };
+    writeCache(outputPath, cache);
+
+    return result;
   } catch (error) {
     console.error(`Markdown conversion failed: ${error}`);
     return {
@@ -275,4 +442,187 @@ export function convertMdToIpynb(sourcePath: string, outputDir: string): Convers
       message: error instanceof Error ? error.message : String(error)
     };
   }
-}
\ No newline at end of file
+}
+
+// Batches smaller than this are converted in-process; worker-thread spawn
+// overhead would outweigh the parallelism win
+const PARALLEL_BATCH_THRESHOLD = 4;
+
+/**
+ * Run one batch-worker thread over a slice of files
+ * Resolves with the per-file results the worker posts back
+ */
+function runBatchWorker(
+  direction: ConversionDirection,
+  files: string[],
+  outputDir: string,
+  fenceMarker?: string,
+  skipMkdir: boolean = false
+): Promise<{ path: string; result: ConversionResult }[]> {
+  return new Promise((resolve, reject) => {
+    const worker = new Worker(path.join(__dirname, 'batch-worker.js'), {
+      workerData: { direction, files, outputDir, fenceMarker, skipMkdir }
+    });
+    worker.once('message', resolve);
+    worker.once('error', reject);
+    worker.once('exit', (code) => {
+      if (code !== 0) {
+        reject(new Error(`Batch worker exited with code ${code}`));
+      }
+    });
+  });
+}
+
+// One worker thread is kept warm across single-file tool calls; spawning a
+// fresh thread per call costs far more than a small (or cached) conversion
+let persistentWorker: Worker | null = null;
+let nextTaskId = 0;
+const pendingTasks = new Map<
+  number,
+  { resolve: (result: ConversionResult) => void; reject: (error: Error) => void }
+>();
+
+function failPendingTasks(worker: Worker, error: Error): void {
+  if (persistentWorker === worker) {
+    persistentWorker = null;
+  }
+  const failed = Array.from(pendingTasks.values());
+  pendingTasks.clear();
+  for (const { reject } of failed) {
+    reject(error);
+  }
+}
+
+function getPersistentWorker(): Worker {
+  if (!persistentWorker) {
+    const worker = new Worker(path.join(__dirname, 'batch-worker.js'));
+    worker.on('message', ({ id, result }: { id: number; result: ConversionResult }) => {
+      const pending = pendingTasks.get(id);
+      if (pending) {
+        pendingTasks.delete(id);
+        pending.resolve(result);
+      }
+      // Don't let an idle worker keep the process alive
+      if (pendingTasks.size === 0) {
+        worker.unref();
+      }
+    });
+    worker.on('error', (error) => failPendingTasks(worker, error));
+    worker.on('exit', (code) => {
+      failPendingTasks(worker, new Error(`Conversion worker exited with code ${code}`));
+    });
+    persistentWorker = worker;
+  }
+  return persistentWorker;
+}
+
+/**
+ * Run a single-file conversion on the persistent worker thread
+ * The converters do blocking reads, scans and writes; handing them to a
+ * worker keeps the MCP stdio event loop free to serve concurrent requests,
+ * and reusing one warm worker avoids per-call thread bootstrap
+ */
+export function convertFileAsync(
+  direction: ConversionDirection,
+  sourcePath: string,
+  outputDir: string,
+  fenceMarker?: string
+): Promise<ConversionResult> {
+  return new Promise((resolve, reject) => {
+    const worker = getPersistentWorker();
+    const id = nextTaskId++;
+    pendingTasks.set(id, { resolve, reject });
+    worker.ref();
+    worker.postMessage({ id, direction, sourcePath, outputDir, fenceMarker });
+  });
+}
+
+/**
+ * Convert every notebook or markdown file in a directory in a single call
+ * Amortizes per-file MCP round-trip overhead when converting large batches
+ * Large batches are spread across worker threads (one slice per thread);
+ * per-file failures are recorded in the result instead of aborting the batch
+ */
+export async function convertDirectory(
+  sourceDir: string,
+  outputDir: string,
+  direction: ConversionDirection,
+  maxWorkers?: number
+): Promise<BatchConversionResult> {
+  try {
+    const sourcePath = path.resolve(sourceDir);
+
+    if (!fs.existsSync(sourcePath) || !fs.statSync(sourcePath).isDirectory()) {
+      throw new Error(`Source directory not found: ${sourceDir}`);
+    }
+
+    if (!['ipynb_to_md', 'md_to_ipynb'].includes(direction)) {
+      throw new Error(`direction must be 'ipynb_to_md' or 'md_to_ipynb', got: ${direction}`);
+    }
+
+    const wantedExts = direction === 'ipynb_to_md' ? ['.ipynb'] : ['.md', '.markdown'];
+
+    // Single readdir with dirent types instead of a stat call per entry
+    const files = fs.readdirSync(sourcePath, { withFileTypes: true })
+      .filter((entry) => entry.isFile() && wantedExts.includes(path.extname(entry.name).toLowerCase()))
+      .map((entry) => path.join(sourcePath, entry.name));
+
+    log("Starting batch conversion of %d files in '%s'...", files.length, sourcePath);
+
+    // Create the output directory once for the whole batch; the per-file
+    // calls below skip their own mkdir check
+    fs.mkdirSync(path.resolve(outputDir), { recursive: true });
+
+    const workerCount = Math.min(
+      maxWorkers && maxWorkers > 0 ? maxWorkers : os.cpus().length,
+      files.length
+    );
+
+    let outcomes: { path: string; result: ConversionResult }[];
+
+    if (workerCount <= 1 || files.length < PARALLEL_BATCH_THRESHOLD) {
+      // Small batch: convert in-process, no worker spawn overhead
+      outcomes = files.map((file) => ({
+        path: file,
+        result: direction === 'ipynb_to_md'
+          ? convertIpynbToMd(file, outputDir, true)
+          : convertMdToIpynb(file, outputDir, DEFAULT_FENCE_MARKER, true)
+      }));
+    } else {
+      // Round-robin the files into one slice per worker to keep sizes balanced
+      const slices: string[][] = Array.from({ length: workerCount }, () => []);
+      files.forEach((file, i) => slices[i % workerCount].push(file));
+
+      const sliceResults = await Promise.all(
+        slices.map((slice) => runBatchWorker(direction, slice, outputDir, undefined, true))
+      );
+      outcomes = sliceResults.flat();
+    }
+
+    const converted: { path: string; output_path: string }[] = [];
+    const failed: { path: string; error: string }[] = [];
+
+    for (const { path: file, result } of outcomes) {
+      if (result.status === 'success' && result.output_path) {
+        converted.push({ path: file, output_path: result.output_path });
+      } else {
+        failed.push({ path: file, error: result.message || 'Unknown error' });
+      }
+    }
+
+    log('Batch conversion finished. %d converted, %d failed.', converted.length, failed.length);
+
+    return {
+      status: 'success',
+      converted,
+      failed,
+      total_files: files.length
+    };
+  } catch (error) {
+    console.error(`Batch conversion failed: ${error}`);
+    return {
+      status: 'error',
+      message: error instanceof Error ? error.message : String(error)
+    };
+  }
+}
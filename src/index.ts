@@ -11,8 +11,8 @@ import {
   CallToolRequestSchema,
   ListToolsRequestSchema,
 } from '@modelcontextprotocol/sdk/types.js';
-import { convertIpynbToMd, convertMdToIpynb } from './converter-logic.js';
-import { ConvertNotebookArgs, ConvertMarkdownArgs } from './types.js';
+import { convertFileAsync, convertDirectory } from './converter-logic.js';
+import { ConvertNotebookArgs, ConvertMarkdownArgs, ConvertDirectoryArgs } from './types.js';
 
 // Create MCP server instance
 const server = new Server(
@@ -62,10 +62,41 @@ server.setRequestHandler(ListToolsRequestSchema, async () => {
             output_dir: {
               type: 'string',
               description: "Folder path to save the converted .ipynb file (e.g., 'C:\\Users\\Test\\notebooks')"
+            },
+            fence_marker: {
+              type: 'string',
+              description: "Code fence marker to recognize (defaults to '```', e.g. '~~~')"
             }
           },
           required: ['source_path', 'output_dir']
         }
+      },
+      {
+        name: 'convert_directory',
+        description: 'Convert all notebook or markdown files in a directory in one call. Per-file failures are reported in the result instead of aborting the batch.',
+        inputSchema: {
+          type: 'object',
+          properties: {
+            source_dir: {
+              type: 'string',
+              description: "Folder path containing the files to convert (e.g., 'C:\\Users\\Test\\notebooks')"
+            },
+            output_dir: {
+              type: 'string',
+              description: "Folder path to save the converted files (e.g., 'C:\\Users\\Test\\output')"
+            },
+            direction: {
+              type: 'string',
+              enum: ['ipynb_to_md', 'md_to_ipynb'],
+              description: "Conversion direction: 'ipynb_to_md' converts .ipynb files to .md, 'md_to_ipynb' converts .md files to .ipynb"
+            },
+            max_workers: {
+              type: 'number',
+              description: 'Maximum number of worker threads for the batch (defaults to the CPU count)'
+            }
+          },
+          required: ['source_dir', 'output_dir', 'direction']
+        }
       }
     ]
   };
@@ -80,20 +111,36 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
       throw new Error('No arguments provided');
     }
 
-    const { source_path, output_dir } = args as any;
-
-    if (!source_path || !output_dir) {
-      throw new Error('source_path and output_dir are required arguments');
-    }
-
     let result;
     switch (name) {
       case 'convert_notebook':
-        result = convertIpynbToMd(source_path, output_dir);
+      case 'convert_markdown': {
+        const { source_path, output_dir, fence_marker } = args as any;
+
+        if (!source_path || !output_dir) {
+          throw new Error('source_path and output_dir are required arguments');
+        }
+
+        // Run the blocking file work on a worker thread so the stdio event
+        // loop keeps serving concurrent requests
+        result = await convertFileAsync(
+          name === 'convert_notebook' ? 'ipynb_to_md' : 'md_to_ipynb',
+          source_path,
+          output_dir,
+          fence_marker
+        );
         break;
-      case 'convert_markdown':
-        result = convertMdToIpynb(source_path, output_dir);
+      }
+      case 'convert_directory': {
+        const { source_dir, output_dir, direction, max_workers } = args as any;
+
+        if (!source_dir || !output_dir || !direction) {
+          throw new Error('source_dir, output_dir and direction are required arguments');
+        }
+
+        result = await convertDirectory(source_dir, output_dir, direction, max_workers);
         break;
+      }
       default:
         throw new Error(`Unknown tool name: ${name}`);
     }
@@ -87,11 +87,12 @@ async function runInstallation(): Promise<void> {
   console.log('\n🎉 Installation complete!');
   console.log('\n📋 Next steps:');
   console.log('1. Restart Claude Code CLI completely');
-  console.log('2. Look for: 🟢 jupyter-markdown-mcp - Connected (2 tools cached)');
-  console.log('3. Use convert_notebook and convert_markdown tools');
+  console.log('2. Look for: 🟢 jupyter-markdown-mcp - Connected (3 tools cached)');
+  console.log('3. Use convert_notebook, convert_markdown and convert_directory tools');
   console.log('\n💡 Usage examples:');
   console.log('• Convert notebook to markdown: "Use convert_notebook to convert my .ipynb files"');
   console.log('• Convert markdown to notebook: "Use convert_markdown to convert .md to .ipynb"');
+  console.log('• Convert a whole folder: "Use convert_directory to convert every notebook in ./notebooks"');
   console.log('\n📚 Documentation: https://github.com/hyunjae-labs/jupyter-markdown-mcp');
   console.log('🐛 Issues: https://github.com/hyunjae-labs/jupyter-markdown-mcp/issues');
 }
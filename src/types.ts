@@ -38,6 +38,17 @@ export interface ConversionResult {
   cells_processed?: Record<string, number>;
   cells_created?: Record<string, number>;
   total_cells?: number;
+  cached?: boolean;
+  message?: string;
+}
+
+export type ConversionDirection = 'ipynb_to_md' | 'md_to_ipynb';
+
+export interface BatchConversionResult {
+  status: 'success' | 'error';
+  converted?: { path: string; output_path: string }[];
+  failed?: { path: string; error: string }[];
+  total_files?: number;
   message?: string;
 }
 
@@ -49,6 +60,14 @@ export interface ConvertNotebookArgs {
 export interface ConvertMarkdownArgs {
   source_path: string;
   output_dir: string;
+  fence_marker?: string;
+}
+
+export interface ConvertDirectoryArgs {
+  source_dir: string;
+  output_dir: string;
+  direction: ConversionDirection;
+  max_workers?: number;
 }
 
 export interface McpServerConfig {